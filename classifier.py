@@ -2,19 +2,77 @@
 
 from __future__ import annotations
 
+import atexit
+import bisect
+import json
+import os
+import re
 import shutil
 import sqlite3
 import tempfile
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from urllib.parse import urlparse
 
 from platforms import ALL_ADAPTERS, get_adapter
 from platforms.base import PlatformAdapter
 from platforms.generic import GenericAdapter
 
+# Source History DB -> (st_mtime_ns, st_size, copy path).  Lets repeat scans
+# reuse the previous copy when Chrome hasn't touched the DB since.
+_HISTORY_CACHE: dict[Path, tuple[int, int, Path]] = {}
 
-@dataclass
+_CACHE_DIR = Path.home() / ".cache" / "school_classifier"
+_SUBTYPE_CACHE_PATH = _CACHE_DIR / "subtype_cache.json"
+_LAST_SCAN_PATH = _CACHE_DIR / "last_scan.json"
+_COURSE_NAME_CACHE_PATH = _CACHE_DIR / "course_names.json"
+# Discovered course names are re-checked after this long, in case the
+# platform's page titles changed (e.g. a course renamed for a new term).
+_COURSE_NAME_TTL = 30 * 24 * 60 * 60
+
+
+def _load_cache_dict(path: Path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_cache_json(path: Path, data) -> None:
+    """Write a cache file atomically (tmp file + rename) so a crash can't corrupt it."""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+_NON_WORD_RE = re.compile(r"\W+")
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def _name_shape(filename: str) -> str:
+    """Cache key for *filename*: lowercased, with digit runs collapsed.
+
+    "Lecture01_2024.pdf" and "Lecture15_2023.pdf" both become
+    "lecture#_#_pdf", so a term's worth of numbered files shares one entry.
+    """
+    return _DIGITS_RE.sub("#", _NON_WORD_RE.sub("_", filename.lower()))
+
+
+# Filename shape (see _name_shape) -> sub_type from previous LLM classifications.
+_SUBTYPE_CACHE: dict[str, str] = _load_cache_dict(_SUBTYPE_CACHE_PATH)
+
+# "platform|domain|course_id" -> [course name, unix time discovered].
+_COURSE_NAME_CACHE: dict[str, list] = _load_cache_dict(_COURSE_NAME_CACHE_PATH)
+
+
+@dataclass(slots=True)
 class ClassifiedFile:
     path: Path
     course_id: str
@@ -24,7 +82,7 @@ class ClassifiedFile:
     sub_type: str = "Other"  # Lectures, Tutorials, Assignments, Other
 
 
-@dataclass
+@dataclass(slots=True)
 class NewCourse:
     """A newly discovered course not yet in config."""
     course_id: str
@@ -45,37 +103,122 @@ def _get_chrome_history_db() -> Path:
         return home / ".config" / "google-chrome" / "Default" / "History"
 
 
+def history_mtime_ns() -> int:
+    """Return the modification time of Chrome's History DB (0 if it doesn't exist)."""
+    try:
+        return _get_chrome_history_db().stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _cleanup_history_copies() -> None:
+    for _, _, copy_path in _HISTORY_CACHE.values():
+        copy_path.unlink(missing_ok=True)
+    _HISTORY_CACHE.clear()
+
+
+atexit.register(_cleanup_history_copies)
+
+
+def _copy_history_db(chrome_db: Path) -> Path:
+    """Copy Chrome's History DB aside (avoids Chrome's lock), reusing the last copy if unchanged."""
+    st = os.stat(chrome_db)
+    cached = _HISTORY_CACHE.get(chrome_db)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size) and cached[2].exists():
+        return cached[2]
+
+    _HISTORY_CACHE.pop(chrome_db, None)  # don't trust a half-written copy
+    if cached and cached[2].exists():
+        tmp_path = cached[2]
+    else:
+        # A private file per process: no collisions with other users or
+        # instances, and nothing pre-planted at a predictable path.
+        fd, name = tempfile.mkstemp(prefix="school_classifier_", suffix=".db")
+        os.close(fd)
+        tmp_path = Path(name)
+    try:
+        shutil.copyfile(chrome_db, tmp_path)  # keeps mkstemp's 0600 mode
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _HISTORY_CACHE[chrome_db] = (st.st_mtime_ns, st.st_size, tmp_path)
+    return tmp_path
+
+
+def _open_history_db(db_path: Path) -> sqlite3.Connection:
+    """Open a History DB read-only, in place.
+
+    ``immutable=1`` makes SQLite skip locking and journal checks, so Chrome's
+    live file can be read while Chrome has it open — no copy needed.
+    """
+    conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro&immutable=1", uri=True)
+    conn.executescript(
+        """
+        PRAGMA query_only = ON;
+        PRAGMA temp_store = MEMORY;       -- GROUP BY / ORDER BY scratch space
+        PRAGMA cache_size = -65536;       -- 64 MiB page cache
+        PRAGMA mmap_size = 268435456;
+        """
+    )
+    return conn
+
+
+def _domain_pattern(platform_configs: list[dict]) -> re.Pattern[str]:
+    """Compile one alternation over all configured domains.
+
+    Group ``p<i>`` matches the domain of ``platform_configs[i]``, so a single
+    ``search`` tells which platform (if any) a URL belongs to.
+    """
+    return re.compile(
+        "|".join(
+            f"(?P<p{i}>{re.escape(pcfg['domain'])})"
+            for i, pcfg in enumerate(platform_configs)
+        )
+    )
+
+
+def _netloc(url: str) -> str:
+    """Host part of an absolute URL ("" if none), without a full urlparse."""
+    start = url.find("://")
+    if start < 0:
+        return ""
+    start += 3
+    end = len(url)
+    for sep in "/?#":
+        i = url.find(sep, start, end)
+        if i >= 0:
+            end = i
+    return url[start:end]
+
+
 def _resolve_adapter(
-    url: str, platform_configs: list[dict]
+    url: str,
+    platforms: list[tuple[str, PlatformAdapter | None]],
+    domain_re: re.Pattern[str],
 ) -> tuple[PlatformAdapter, str] | None:
     """Find the adapter + domain that matches a URL.
 
-    Checks configured platforms first, then falls back to the generic adapter.
+    ``platforms`` holds one ``(domain, adapter)`` pair per configured
+    platform, in config order.  Checks configured platforms first (the
+    earliest configured domain in the URL wins), then falls back to comparing
+    the URL's host.
     """
-    for pcfg in platform_configs:
-        domain = pcfg["domain"]
-        if domain not in url:
-            continue
-        adapter = get_adapter(pcfg["type"])
+    m = domain_re.search(url)
+    if m:
+        domain, adapter = platforms[int(m.lastgroup[1:])]
         if adapter and adapter.matches_url(url, domain):
             return adapter, domain
 
     # Fallback: try to extract domain from URL and use generic adapter
-    try:
-        parsed = urlparse(url)
-        domain = parsed.netloc
-    except Exception:
-        return None
-
+    domain = _netloc(url)
     if not domain:
         return None
 
     # Check if any configured platform domain is in this URL's domain
-    for pcfg in platform_configs:
-        if pcfg["domain"] in domain or domain in pcfg["domain"]:
-            adapter = get_adapter(pcfg["type"])
+    for pcfg_domain, adapter in platforms:
+        if pcfg_domain in domain or domain in pcfg_domain:
             if adapter:
-                return adapter, pcfg["domain"]
+                return adapter, pcfg_domain
 
     return None
 
@@ -96,128 +239,297 @@ def scan_downloads(config: dict) -> tuple[list[ClassifiedFile], list[NewCourse]]
     if not platform_configs:
         return [], []
 
-    # Copy DB to temp file to avoid Chrome's lock
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-    tmp.close()
-    tmp_path = Path(tmp.name)
     try:
-        shutil.copy2(chrome_db, tmp_path)
-        results, new_courses = _query_downloads(
-            tmp_path, download_dir, platform_configs, config
-        )
-    finally:
-        tmp_path.unlink(missing_ok=True)
+        conn = _open_history_db(chrome_db)
+        try:
+            results, new_courses = _query_downloads(
+                conn, download_dir, platform_configs, config
+            )
+        finally:
+            conn.close()
+    except sqlite3.DatabaseError:
+        # Couldn't read the live file (e.g. a Windows share-mode lock, or
+        # Chrome caught mid-write) — query a copy instead.
+        conn = _open_history_db(_copy_history_db(chrome_db))
+        try:
+            results, new_courses = _query_downloads(
+                conn, download_dir, platform_configs, config
+            )
+        finally:
+            conn.close()
 
-    # Sub-classify files using LLM
+    # Sub-classify files using LLM — only name shapes we haven't classified
+    # before, each shape sent once (as the first filename that has it).
     api_key = config.get("groq_api_key", "")
     if results and api_key:
-        from llm import classify_batch
-
-        filenames = [cf.path.name for cf in results]
-        categories = classify_batch(filenames, api_key)
-        for cf, cat in zip(results, categories):
-            cf.sub_type = cat
+        todo: dict[str, list[ClassifiedFile]] = {}
+        for cf in results:
+            key = _name_shape(cf.path.name)
+            cached = _SUBTYPE_CACHE.get(key)
+            if cached:
+                cf.sub_type = cached
+            else:
+                todo.setdefault(key, []).append(cf)
+
+        if todo:
+            from llm import classify_batch
+
+            groups = list(todo.values())
+            categories = classify_batch([g[0].path.name for g in groups], api_key)
+            learned = False
+            for key, group, cat in zip(todo, groups, categories):
+                for cf in group:
+                    cf.sub_type = cat
+                # "Other" is also what classify_batch returns on API failure,
+                # so don't cache it — it'd pin a transient error forever.
+                if cat != "Other":
+                    _SUBTYPE_CACHE[key] = cat
+                    learned = True
+            if learned:
+                _write_cache_json(_SUBTYPE_CACHE_PATH, _SUBTYPE_CACHE)
 
     return results, new_courses
 
 
+def _like_escape(text: str) -> str:
+    """Escape LIKE wildcards in *text*, for use with ``ESCAPE '!'``."""
+    return text.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+
+
+# (domain count, prefix count) -> downloads query text.  Only the number of
+# placeholders varies, so the text is built once per shape and SQLite's
+# statement cache sees the same string on every scan.
+_stmt_cache: dict[tuple[int, int], str] = {}
+
+
+def _downloads_sql(n_domains: int, n_prefixes: int) -> str:
+    """Return the downloads query for this many domains and path prefixes."""
+    key = (n_domains, n_prefixes)
+    sql = _stmt_cache.get(key)
+    if sql is None:
+        # Chrome leaves tab_url/referrer NULL for many downloads; test that
+        # before the leading-wildcard LIKE.
+        domain_filter = " OR ".join(
+            [
+                "(tab_url IS NOT NULL AND tab_url LIKE ?)"
+                " OR (referrer IS NOT NULL AND referrer LIKE ?)"
+            ]
+            * n_domains
+        )
+        # LIKE is ASCII case-insensitive, which suits Windows paths; the exact
+        # parent-directory check still happens per row.
+        prefix_filter = " OR ".join(["target_path LIKE ? ESCAPE '!'"] * n_prefixes)
+        # One row per file: with a single MAX() aggregate, SQLite takes the
+        # bare columns from the most recent download of each path.
+        sql = _stmt_cache[key] = f"""
+        SELECT tab_url, target_path, referrer, MAX(start_time) AS start_time
+        FROM downloads
+        WHERE ({domain_filter}) AND ({prefix_filter})
+        GROUP BY LOWER(target_path)
+        ORDER BY start_time DESC
+        """
+    return sql
+
+
 def _query_downloads(
-    db_path: Path,
+    conn: sqlite3.Connection,
     download_dir: Path,
     platform_configs: list[dict],
     config: dict,
 ) -> tuple[list[ClassifiedFile], list[NewCourse]]:
-    """Query the copied Chrome history DB for matching downloads."""
-    conn = sqlite3.connect(str(db_path))
+    """Query an open Chrome history DB for matching downloads."""
+    cursor = conn.cursor()
+
+    # Resolve the Downloads folder once; rows are then matched on their
+    # parent directory string instead of resolving every path.
+    dir_paths = {os.path.abspath(download_dir), str(download_dir.resolve())}
+    download_dirs = {os.path.normcase(d) for d in dir_paths}
+
+    # Parameters: a LIKE pattern per configured domain (for tab_url and
+    # referrer), then one path prefix per spelling of the Downloads folder.
+    params: list[str] = []
+    for pcfg in platform_configs:
+        like = f"%{pcfg['domain']}%"
+        params.extend([like, like])
+    prefixes = sorted(dir_paths)
+    for d in prefixes:
+        params.append(_like_escape(os.path.join(d, "")) + "%")
+
+    # Its own cursor: ``cursor`` is reused for visit lookups mid-iteration.
+    rows = conn.execute(_downloads_sql(len(platform_configs), len(prefixes)), params)
+
+    # One directory listing instead of a stat() per download row
     try:
-        cursor = conn.cursor()
-
-        # Build a SQL filter for all configured platform domains
-        domain_filters = []
-        params: list[str] = []
-        for pcfg in platform_configs:
-            domain_filters.append("tab_url LIKE ? OR referrer LIKE ?")
-            like = f"%{pcfg['domain']}%"
-            params.extend([like, like])
-
-        where_clause = " OR ".join(f"({f})" for f in domain_filters)
-        cursor.execute(
-            f"""
-            SELECT tab_url, target_path, referrer, start_time
-            FROM downloads
-            WHERE {where_clause}
-            ORDER BY start_time DESC
-            """,
-            params,
+        with os.scandir(download_dir) as entries:
+            present = {os.path.normcase(e.name) for e in entries if e.is_file()}
+    except OSError:
+        present = set()
+
+    domain_re = _domain_pattern(platform_configs)
+    platforms = [
+        (pcfg["domain"], get_adapter(pcfg["type"])) for pcfg in platform_configs
+    ]
+    results: list[ClassifiedFile] = []
+    discovered: dict[str, str] = {}  # course_id -> suggested_name
+    undiscovered: dict[str, tuple[PlatformAdapter, str]] = {}  # course_id -> (adapter, domain)
+    unnamed: list[ClassifiedFile] = []
+    # (adapter name, domain) -> course page visit timeline, built on first need
+    timelines: dict[tuple[str, str], tuple[list[int], list[str]]] = {}
+    # (adapter name, url) -> course ID.  Many downloads share a referrer page,
+    # so each distinct URL only goes through the adapter's regexes once.
+    course_ids: dict[tuple[str, str], str | None] = {}
+
+    def extract_course_id(adapter: PlatformAdapter, url: str) -> str | None:
+        key = (adapter.name, url)
+        if key not in course_ids:
+            course_ids[key] = adapter.extract_course_id(url)
+        return course_ids[key]
+
+    # Same idea for adapter lookup: url -> (adapter, domain) or None
+    adapters_by_url: dict[str, tuple[PlatformAdapter, str] | None] = {}
+
+    def resolve_adapter(url: str) -> tuple[PlatformAdapter, str] | None:
+        if url not in adapters_by_url:
+            adapters_by_url[url] = _resolve_adapter(url, platforms, domain_re)
+        return adapters_by_url[url]
+
+    # Stream rows off their own cursor; `cursor` stays free for the adapter
+    # lookups made inside the loop.
+    for tab_url, target_path, referrer, start_time in rows:
+        # Only include files still sitting in the Downloads folder
+        if not target_path:
+            continue
+        if os.path.normcase(os.path.dirname(target_path)) not in download_dirs:
+            continue
+        if os.path.normcase(os.path.basename(target_path)) not in present:
+            continue
+        file_path = Path(target_path)
+
+        # Find matching adapter
+        resolved = resolve_adapter(tab_url) or resolve_adapter(referrer or "")
+        if not resolved:
+            continue
+
+        adapter, domain = resolved
+
+        # Extract course ID — try tab_url first, then referrer
+        course_id = extract_course_id(adapter, tab_url) or extract_course_id(
+            adapter, referrer or ""
         )
 
-        seen_paths: set[str] = set()
-        results: list[ClassifiedFile] = []
-        discovered: dict[str, str] = {}  # course_id -> suggested_name
-
-        for tab_url, target_path, referrer, start_time in cursor.fetchall():
-            file_path = Path(target_path)
-
-            # Only include files still sitting in the Downloads folder
-            if not file_path.exists():
-                continue
-            try:
-                if file_path.parent.resolve() != download_dir.resolve():
-                    continue
-            except (OSError, ValueError):
-                continue
-
-            # Deduplicate
-            path_key = str(file_path).lower()
-            if path_key in seen_paths:
-                continue
-            seen_paths.add(path_key)
-
-            # Find matching adapter
-            resolved = _resolve_adapter(tab_url, platform_configs)
-            if not resolved:
-                resolved = _resolve_adapter(referrer or "", platform_configs)
-            if not resolved:
-                continue
-
-            adapter, domain = resolved
-
-            # Extract course ID — try tab_url first, then referrer
-            course_id = adapter.extract_course_id(tab_url) or adapter.extract_course_id(
-                referrer or ""
-            )
+        # Fallback: correlate with recently visited course pages
+        if not course_id:
+            key = (adapter.name, domain)
+            if key not in timelines:
+                timelines[key] = adapter.course_visit_timeline(cursor, domain)
+            visit_times, visit_courses = timelines[key]
+            idx = bisect.bisect_right(visit_times, start_time) - 1
+            if idx >= 0:
+                course_id = visit_courses[idx]
+
+        if course_id and course_id in config["courses"]:
+            course_name = config["courses"][course_id]
+        elif course_id:
+            # Unknown course — named once the download rows are done
+            undiscovered.setdefault(course_id, (adapter, domain))
+            course_name = ""
+        else:
+            course_name = "Unknown Course"
+
+        cf = ClassifiedFile(
+            path=file_path,
+            course_id=course_id or "unknown",
+            course_name=course_name,
+            download_url=tab_url,
+            platform=adapter.name,
+        )
+        results.append(cf)
+        if not course_name:
+            unnamed.append(cf)
+
+    # Look up names for new courses in one go, after the main query.  Names
+    # found on earlier runs are reused until they pass _COURSE_NAME_TTL.
+    # The rest are looked up with one query per (adapter, domain).
+    now = time.time()
+    stale: dict[tuple[str, str], tuple[PlatformAdapter, list[str]]] = {}
+    for course_id, (adapter, domain) in undiscovered.items():
+        entry = _COURSE_NAME_CACHE.get(f"{adapter.name}|{domain}|{course_id}")
+        fresh = (
+            isinstance(entry, list)
+            and len(entry) == 2
+            and now - entry[1] < _COURSE_NAME_TTL
+        )
+        if fresh:
+            discovered[course_id] = entry[0]
+        else:
+            stale.setdefault((adapter.name, domain), (adapter, []))[1].append(course_id)
+    learned = False
+    for (platform, domain), (adapter, ids) in stale.items():
+        names = adapter.discover_course_names(cursor, ids, domain)
+        for course_id, name in names.items():
+            _COURSE_NAME_CACHE[f"{platform}|{domain}|{course_id}"] = [name, now]
+            discovered[course_id] = name
+            learned = True
+    for course_id in undiscovered:
+        discovered.setdefault(course_id, f"New Course ({course_id[:8]})")
+    if learned:
+        _write_cache_json(_COURSE_NAME_CACHE_PATH, _COURSE_NAME_CACHE)
+    for cf in unnamed:
+        cf.course_name = discovered[cf.course_id]
+
+    # In the order the courses were first seen, not the order they were named
+    new_courses = [
+        NewCourse(course_id=cid, suggested_name=discovered[cid])
+        for cid in undiscovered
+    ]
+    return results, new_courses
 
-            # Fallback: correlate with recently visited course pages
-            if not course_id:
-                course_id = adapter.infer_course_from_visits(
-                    cursor, start_time, domain
-                )
-
-            if course_id and course_id in config["courses"]:
-                course_name = config["courses"][course_id]
-            elif course_id:
-                # Unknown course — try to discover its name
-                if course_id not in discovered:
-                    name = adapter.discover_course_name(cursor, course_id, domain)
-                    discovered[course_id] = name if name else f"New Course ({course_id[:8]})"
-                course_name = discovered[course_id]
-            else:
-                course_name = "Unknown Course"
-
-            results.append(
-                ClassifiedFile(
-                    path=file_path,
-                    course_id=course_id or "unknown",
-                    course_name=course_name,
-                    download_url=tab_url,
-                    platform=adapter.name,
-                )
-            )
 
-        new_courses = [
-            NewCourse(course_id=cid, suggested_name=name)
-            for cid, name in discovered.items()
+# ── Last scan persistence ────────────────────────────────────────────────
+
+
+def _scan_settings(config: dict) -> dict:
+    """The config values a saved scan depends on."""
+    return {
+        "download_dir": config.get("download_dir", ""),
+        "platforms": config.get("platforms", []),
+        "courses": config.get("courses", {}),
+    }
+
+
+def save_last_scan(
+    files: list[ClassifiedFile], config: dict, history_mtime: int
+) -> None:
+    """Save scan results so the next launch can show them before rescanning.
+
+    *history_mtime* is the History DB's mtime when the scan started.
+    """
+    _write_cache_json(_LAST_SCAN_PATH, {
+        "history_mtime_ns": history_mtime,
+        "settings": _scan_settings(config),
+        "files": [{**asdict(cf), "path": str(cf.path)} for cf in files],
+    })
+
+
+def load_last_scan(config: dict) -> tuple[list[ClassifiedFile], int]:
+    """Load the saved scan results, dropping files no longer in place.
+
+    Returns (files, history_mtime_ns).  If the History DB's mtime still
+    matches, a rescan would find nothing new.  Returns ([], 0) if there is
+    no usable saved scan for this config.
+    """
+    try:
+        with open(_LAST_SCAN_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            return [], 0
+        if data.get("settings") != _scan_settings(config):
+            return [], 0
+        files = [
+            ClassifiedFile(**{**row, "path": Path(row["path"])})
+            for row in data["files"]
         ]
-        return results, new_courses
-    finally:
-        conn.close()
+        history_mtime = int(data["history_mtime_ns"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return [], 0
+    return [cf for cf in files if cf.path.is_file()], history_mtime
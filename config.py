@@ -1,5 +1,6 @@
 """Configuration management for School File Classifier."""
 
+import copy
 import json
 import sys
 from pathlib import Path
@@ -13,6 +14,10 @@ else:
 
 CONFIG_PATH = _BASE_DIR / "config.json"
 
+# (mtime_ns, parsed config) of the last load, so reopening a dialog doesn't
+# re-read and re-merge config.json while the file is unchanged.
+_cache: tuple[int, dict] | None = None
+
 DEFAULTS = {
     "download_dir": str(Path.home() / "Downloads"),
     "destination_root": str(Path.home() / "Documents" / "School"),
@@ -48,24 +53,36 @@ def _migrate_v1_config(config: dict) -> dict:
 
 
 def load_config() -> dict:
-    """Load config from disk, creating with defaults if missing."""
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            config = json.load(f)
+    """Load config from disk, creating with defaults if missing.
+
+    Returns a fresh copy each call; callers are free to mutate it.
+    """
+    global _cache
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime is not None:
+        if _cache and _cache[0] == mtime:
+            return copy.deepcopy(_cache[1])
+        config = json.loads(CONFIG_PATH.read_bytes())
         # Migrate old format if needed
         config = _migrate_v1_config(config)
         # Merge any new default keys the user doesn't have yet
         for key, value in DEFAULTS.items():
             if key not in config:
-                config[key] = value
-        return config
+                config[key] = copy.deepcopy(value)
+        _cache = (mtime, config)
+        return copy.deepcopy(config)
     # First run — write defaults
     save_config(DEFAULTS)
-    return dict(DEFAULTS)
+    return copy.deepcopy(DEFAULTS)
 
 
 def save_config(config: dict) -> None:
     """Persist config to disk."""
+    global _cache
+    _cache = None
     with open(CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(config, f, indent=2, ensure_ascii=False)
 
@@ -1,17 +1,26 @@
 """File move operations with undo support."""
 
+import errno
+import os
+import re
 import shutil
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
+# Batches smaller than this are moved in order on the calling thread.
+_PARALLEL_MIN_FILES = 4
+_MAX_MOVE_WORKERS = 8
 
-@dataclass
+
+@dataclass(slots=True)
 class MoveRecord:
     original: Path
     destination: Path
 
 
-@dataclass
+@dataclass(slots=True)
 class MoveResult:
     success: list[MoveRecord] = field(default_factory=list)
     skipped: list[tuple[Path, str]] = field(default_factory=list)
@@ -34,32 +43,94 @@ class FileOps:
         Returns a MoveResult. The batch is added to the undo stack.
         """
         result = MoveResult()
-        batch: list[MoveRecord] = []
+        created: set[Path] = set()
+        # dest_dir -> names in it, listed on the first rename conflict there
+        listings: dict[Path, set[str]] = {}
+        # dest_dir -> (normcased) names already claimed by this batch; the
+        # moves themselves only happen once every destination is decided.
+        claimed: dict[Path, set[str]] = {}
+        # directory -> st_dev, to spot moves that are a plain rename
+        devices: dict[Path, int] = {}
+        planned: list[tuple[Path, Path, bool]] = []
 
         for src, dest_dir in files:
             if not src.exists():
                 result.skipped.append((src, "File no longer exists"))
                 continue
 
-            dest_dir.mkdir(parents=True, exist_ok=True)
+            if dest_dir not in created:
+                dest_dir.mkdir(parents=True, exist_ok=True)
+                created.add(dest_dir)
             dest = dest_dir / src.name
+            taken = claimed.setdefault(dest_dir, set())
+            same_device = _device(src.parent, devices) == _device(dest_dir, devices)
 
-            if dest.exists():
+            in_batch = os.path.normcase(dest.name) in taken
+            if in_batch or dest.exists():
                 if on_conflict == "skip":
                     result.skipped.append((src, "File already exists at destination"))
                     continue
                 elif on_conflict == "rename":
-                    dest = _unique_name(dest)
+                    names = listings.get(dest_dir)
+                    if names is None:
+                        names = listings[dest_dir] = _list_names(dest_dir) | taken
+                    dest = _unique_name(dest, names)
                 elif on_conflict == "overwrite":
-                    dest.unlink()
-
-            shutil.move(str(src), str(dest))
-            record = MoveRecord(original=src, destination=dest)
-            batch.append(record)
-            result.success.append(record)
+                    if in_batch:
+                        result.skipped.append(
+                            (src, "Another file in this batch has the same name")
+                        )
+                        continue
+                    if not same_device:  # os.replace overwrites by itself
+                        dest.unlink()
+
+            taken.add(os.path.normcase(dest.name))
+            # Keep a listing made for an earlier conflict in step with every
+            # name claimed since, or the next _unique_name could reuse one.
+            names = listings.get(dest_dir)
+            if names is not None:
+                names.add(dest.name)
+            planned.append((src, dest, same_device))
+
+        # The moves below replace whatever sits at each destination, so two
+        # planned moves must never share one.
+        if len({os.path.normcase(dest) for _, dest, _ in planned}) != len(planned):
+            raise RuntimeError("move_files planned two moves to the same destination")
 
+        batch: list[MoveRecord] = []
+        error: Exception | None = None
+        if len(planned) < _PARALLEL_MIN_FILES:
+            # Stop at the first failure, but still record the moves already
+            # done (below), so they can be undone.
+            for src, dest, same_device in planned:
+                try:
+                    _move(src, dest, same_device)
+                except Exception as exc:
+                    error = exc
+                    break
+                batch.append(MoveRecord(original=src, destination=dest))
+        else:
+            # Moves are I/O-bound (a copy when crossing volumes), so a few
+            # threads overlap them.  Every move is waited for before the
+            # first failure is re-raised, so the undo stack stays complete.
+            workers = min(_MAX_MOVE_WORKERS, len(planned))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    (pool.submit(_move, src, dest, same_device), src, dest)
+                    for src, dest, same_device in planned
+                ]
+                for future, src, dest in futures:
+                    exc = future.exception()
+                    if exc is None:
+                        batch.append(MoveRecord(original=src, destination=dest))
+                    elif error is None:
+                        error = exc
+
+        result.success.extend(batch)
         if batch:
             self._undo_stack.append(batch)
+        if error is not None:
+            raise error
 
         return result
 
@@ -84,14 +155,50 @@ class FileOps:
         return undone
 
 
-def _unique_name(path: Path) -> Path:
-    """Generate a unique filename by appending (1), (2), etc."""
+def _device(directory: Path, devices: dict[Path, int]) -> int:
+    """st_dev of a directory, memoized in ``devices``."""
+    if directory not in devices:
+        devices[directory] = os.stat(directory).st_dev
+    return devices[directory]
+
+
+def _move(src: Path, dest: Path, same_device: bool) -> None:
+    """Move one file, as a single rename when it stays on one volume."""
+    if same_device:
+        try:
+            os.replace(src, dest)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+    shutil.move(str(src), str(dest))
+
+
+def _list_names(directory: Path) -> set[str]:
+    """Names of the entries in a directory (empty if it can't be read)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {e.name for e in entries}
+    except OSError:
+        return set()
+
+
+def _unique_name(path: Path, names: Iterable[str] | None = None) -> Path:
+    """Generate a unique filename by appending (1), (2), etc.
+
+    Picks one past the highest counter already used for this name, reading
+    the directory once instead of probing each candidate.  ``names`` is the
+    directory listing if the caller already has it.
+    """
     stem = path.stem
     suffix = path.suffix
     parent = path.parent
-    counter = 1
-    while True:
-        candidate = parent / f"{stem} ({counter}){suffix}"
-        if not candidate.exists():
-            return candidate
-        counter += 1
+    if names is None:
+        names = _list_names(parent)
+    pattern = re.compile(
+        re.escape(stem) + r" \((\d+)\)" + re.escape(suffix) + "$", re.IGNORECASE
+    )
+    highest = max(
+        (int(m.group(1)) for name in names if (m := pattern.match(name))), default=0
+    )
+    return parent / f"{stem} ({highest + 1}){suffix}"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
+    QCheckBox,
     QDialog,
     QDialogButtonBox,
     QFormLayout,
@@ -151,7 +152,6 @@ class PlatformSetupDialog(QDialog):
         self._checkboxes: list[tuple[dict, QLineEdit]] = []
         for det in detected:
             row = QHBoxLayout()
-            from PySide6.QtWidgets import QCheckBox
             cb = QCheckBox()
             cb.setChecked(True)
             row.addWidget(cb)
@@ -191,8 +191,6 @@ class PlatformSetupDialog(QDialog):
         layout.addLayout(btn_layout)
 
     def _confirm(self) -> None:
-        from PySide6.QtWidgets import QCheckBox
-
         self.confirmed = []
         for det, cb in self._checkboxes:
             if cb.isChecked():
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import sys
+from contextlib import contextmanager
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QProcess, Qt, Signal
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QAbstractItemView,
@@ -18,6 +21,17 @@ from classifier import ClassifiedFile
 
 # Role for storing ClassifiedFile on tree items
 CF_ROLE = Qt.ItemDataRole.UserRole
+# Role for a file item's index into the widget's per-file arrays
+INDEX_ROLE = Qt.ItemDataRole.UserRole + 1
+# Role on a collapsed folder's placeholder child: the (start, end) slice of
+# the per-file arrays whose items get created when the folder is expanded
+RANGE_ROLE = Qt.ItemDataRole.UserRole + 2
+# Role for a folder item's sub_type ("" on course nodes)
+SUB_TYPE_ROLE = Qt.ItemDataRole.UserRole + 3
+
+# Above this many files, sub-type folders start collapsed and only build
+# their file items on first expand
+_EAGER_FILE_LIMIT = 500
 
 SUB_TYPE_ICONS = {
     "Lectures": "\U0001f4d6",
@@ -28,6 +42,18 @@ SUB_TYPE_ICONS = {
 
 SUB_TYPES = ["Lectures", "Tutorials", "Assignments", "Other"]
 _SUB_ORDER = ["Lectures", "Tutorials", "Assignments", "Other", ""]
+_SUB_RANK = {sub: i for i, sub in enumerate(_SUB_ORDER)}
+# "{icon} {sub_type} ({count})" with everything but the count filled in
+_SUB_LABEL_TEMPLATES = {sub: f"{SUB_TYPE_ICONS[sub]} {sub} ({{}})" for sub in SUB_TYPES}
+_KNOWN_COURSE_PREFIX = "\U0001f4c2 "
+_NEW_COURSE_PREFIX = "\u26a0\ufe0f "
+
+
+def _sub_label(sub_type: str, count: int) -> str:
+    template = _SUB_LABEL_TEMPLATES.get(sub_type)
+    if template is None:
+        return f"\U0001f4c1 {sub_type} ({count})"
+    return template.format(count)
 
 
 class FileTreeWidget(QTreeWidget):
@@ -43,7 +69,8 @@ class FileTreeWidget(QTreeWidget):
 
     # Emitted when the set of checked files changes.  Argument is the count.
     selection_changed = Signal(int)
-    # Emitted when a file is recategorized via drag-drop or context menu.
+    # Emitted when a file recategorized via drag-drop or context menu couldn't
+    # be moved in place, so the tree needs repopulating.
     file_recategorized = Signal()
 
     def __init__(self, parent=None):
@@ -59,9 +86,21 @@ class FileTreeWidget(QTreeWidget):
 
         self.customContextMenuRequested.connect(self._show_context_menu)
         self.itemChanged.connect(self._on_item_changed)
+        self.itemExpanded.connect(self._load_children)
+        self._build_context_menu()
 
         self._classified_files: list[ClassifiedFile] = []
-        self._suppress_signals = False
+        # Files in tree order, with one check byte per file, indexed by each
+        # file item's INDEX_ROLE (or a placeholder's RANGE_ROLE while its
+        # folder is unexpanded) — checked_files() needn't walk the tree
+        self._files: list[ClassifiedFile] = []
+        self._checked = bytearray()
+        # Running total of set bytes in _checked, so checked_count() is O(1)
+        # on every itemChanged of a folder cascade
+        self._checked_count = 0
+        # (course_name, sub_type) -> folder item; sub_type "" is the course node
+        self._sub_nodes: dict[tuple[str, str], QTreeWidgetItem] = {}
+        self._course_count = 0
 
     # ── Public API ────────────────────────────────────────────────────────
 
@@ -72,29 +111,121 @@ class FileTreeWidget(QTreeWidget):
         known_courses: set[str],
     ) -> None:
         """Clear and rebuild the tree from classified files."""
-        self._suppress_signals = True
-        self._classified_files = files
-        self.clear()
-
-        if not files:
-            empty = QTreeWidgetItem(self, ["No files found. Press Scan to refresh."])
-            empty.setFlags(Qt.ItemFlag.NoItemFlags)
-            self._suppress_signals = False
-            self.selection_changed.emit(0)
-            return
+        with self._batch_update():
+            self._classified_files = files
+            self._files = []
+            self._sub_nodes = {}
+            self._course_count = 0
+            self.clear()
+
+            if files:
+                self._build_items(files, known_courses)
+            else:
+                empty = QTreeWidgetItem(self, ["No files found. Press Scan to refresh."])
+                empty.setFlags(Qt.ItemFlag.NoItemFlags)
+            # Every file item starts checked
+            self._checked = bytearray(b"\x01") * len(self._files)
+            self._checked_count = len(self._files)
+        self.selection_changed.emit(self.checked_count())
+
+    @property
+    def stats(self) -> tuple[int, int]:
+        """(file count, course count) of the last populate()."""
+        return len(self._files), self._course_count
+
+    def checked_files(self) -> list[ClassifiedFile]:
+        """Return all ClassifiedFile objects that are currently checked."""
+        return [cf for cf, on in zip(self._files, self._checked) if on]
+
+    def checked_count(self) -> int:
+        """Return the number of checked file items."""
+        return self._checked_count
+
+    def set_all_checked(self, checked: bool) -> None:
+        """Check or uncheck all file items."""
+        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        with self._batch_update():
+            for i in range(self.topLevelItemCount()):
+                item = self.topLevelItem(i)
+                if item.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+                    item.setCheckState(0, state)
+            self._checked[:] = (b"\x01" if checked else b"\x00") * len(self._checked)
+            self._checked_count = len(self._checked) if checked else 0
+        self.selection_changed.emit(self.checked_count())
 
-        # Group: course -> sub_type -> files
-        courses: dict[str, dict[str, list[ClassifiedFile]]] = defaultdict(
-            lambda: defaultdict(list)
+    def relocate_file_item(self, item: QTreeWidgetItem) -> bool:
+        """Move a file item under the folder matching its (updated) sub_type.
+
+        Re-parents the existing item in place, so other items keep their
+        check state, creating the sub-type folder if the course has none yet.
+        Returns False without touching the tree if the sub_type isn't one the
+        tree shows — the caller should repopulate instead.
+        """
+        cf = item.data(0, CF_ROLE)
+        old_parent = item.parent()
+        if not cf or old_parent is None:
+            return False
+        course_item = self._sub_nodes.get((cf.course_name, ""))
+        if course_item is None or cf.sub_type not in _SUB_RANK:
+            return False
+        target = self._sub_nodes.get((cf.course_name, cf.sub_type))
+        if target is old_parent:
+            return True
+
+        if target is not None:
+            # Materialize the target first so the item lands among its siblings
+            self._load_children(target)
+        with self._batch_update():
+            if target is None:
+                target = self._insert_folder(course_item, cf.course_name, cf.sub_type)
+            old_parent.takeChild(old_parent.indexOfChild(item))
+            target.addChild(item)
+            for folder in (old_parent, target):
+                sub_type = folder.data(0, SUB_TYPE_ROLE)
+                if not sub_type:
+                    continue
+                if folder.childCount():
+                    folder.setText(0, _sub_label(sub_type, folder.childCount()))
+                else:
+                    # A full rebuild wouldn't show an empty folder either
+                    folder.parent().removeChild(folder)
+                    del self._sub_nodes[(cf.course_name, sub_type)]
+        return True
+
+    # ── Private helpers ───────────────────────────────────────────────────
+
+    @contextmanager
+    def _batch_update(self):
+        """Block signals and repaints for a bulk change to the tree.
+
+        The view lays out and repaints once on exit instead of once per
+        inserted or re-checked item.  Nests safely.
+        """
+        was_blocked = self.blockSignals(True)
+        was_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(was_enabled)
+            self.blockSignals(was_blocked)
+
+    def _build_items(
+        self, files: list[ClassifiedFile], known_courses: set[str]
+    ) -> None:
+        # Sort once by (course, sub-folder order) and emit nodes group by group
+        unranked = len(_SUB_ORDER)
+        ordered = sorted(
+            files,
+            key=lambda cf: (cf.course_name, _SUB_RANK.get(cf.sub_type, unranked)),
         )
-        for cf in files:
-            courses[cf.course_name][cf.sub_type].append(cf)
+        lazy = len(files) > _EAGER_FILE_LIMIT
 
-        for course_name in sorted(courses):
+        for course_name, course_files in groupby(ordered, key=attrgetter("course_name")):
             if course_name in known_courses:
-                label = f"\U0001f4c2 {course_name}"
+                label = _KNOWN_COURSE_PREFIX + course_name
             else:
-                label = f"\u26a0\ufe0f {course_name} (new)"
+                label = f"{_NEW_COURSE_PREFIX}{course_name} (new)"
             course_item = QTreeWidgetItem(self, [label])
             course_item.setFlags(
                 Qt.ItemFlag.ItemIsEnabled
@@ -102,88 +233,127 @@ class FileTreeWidget(QTreeWidget):
                 | Qt.ItemFlag.ItemIsAutoTristate
             )
             course_item.setCheckState(0, Qt.CheckState.Checked)
+            course_item.setData(0, SUB_TYPE_ROLE, "")
             course_item.setExpanded(True)
+            self._sub_nodes[(course_name, "")] = course_item
+            self._course_count += 1
 
-            subs = courses[course_name]
-            for sub_type in _SUB_ORDER:
-                if sub_type not in subs:
+            for sub_type, group in groupby(course_files, key=attrgetter("sub_type")):
+                if sub_type not in _SUB_RANK:
                     continue
-                sub_files = subs[sub_type]
+                start = len(self._files)
+                self._files.extend(group)
+                end = len(self._files)
 
                 if sub_type == "":
                     # Files at course root (no sub-folder)
-                    for cf in sub_files:
-                        self._add_file_item(course_item, cf)
-                else:
-                    icon = SUB_TYPE_ICONS.get(sub_type, "\U0001f4c1")
-                    sub_item = QTreeWidgetItem(
-                        course_item,
-                        [f"{icon} {sub_type} ({len(sub_files)})"],
+                    course_item.addChildren(
+                        [self._make_file_item(index) for index in range(start, end)]
                     )
-                    sub_item.setFlags(
-                        Qt.ItemFlag.ItemIsEnabled
-                        | Qt.ItemFlag.ItemIsUserCheckable
-                        | Qt.ItemFlag.ItemIsAutoTristate
-                        | Qt.ItemFlag.ItemIsDropEnabled
-                    )
-                    sub_item.setCheckState(0, Qt.CheckState.Checked)
-                    sub_item.setExpanded(True)
-                    for cf in sub_files:
-                        self._add_file_item(sub_item, cf)
-
-        self._suppress_signals = False
-        self.selection_changed.emit(self.checked_count())
-
-    def checked_files(self) -> list[ClassifiedFile]:
-        """Return all ClassifiedFile objects that are currently checked."""
-        result = []
-        for i in range(self.topLevelItemCount()):
-            self._collect_checked(self.topLevelItem(i), result)
-        return result
-
-    def checked_count(self) -> int:
-        """Return the number of checked file items."""
-        return len(self.checked_files())
-
-    def set_all_checked(self, checked: bool) -> None:
-        """Check or uncheck all file items."""
-        self._suppress_signals = True
-        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if item.flags() & Qt.ItemFlag.ItemIsUserCheckable:
-                item.setCheckState(0, state)
-        self._suppress_signals = False
-        self.selection_changed.emit(self.checked_count())
-
-    # ── Private helpers ───────────────────────────────────────────────────
+                else:
+                    sub_item = self._new_folder(sub_type, end - start)
+                    course_item.addChild(sub_item)
+                    self._sub_nodes[(course_name, sub_type)] = sub_item
+                    if lazy:
+                        # Stands in for the files until the folder is
+                        # expanded; it carries their shared check state, so
+                        # the folder's tristate box works before then too
+                        placeholder = QTreeWidgetItem(sub_item)
+                        placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
+                        placeholder.setCheckState(0, Qt.CheckState.Checked)
+                        placeholder.setData(0, RANGE_ROLE, (start, end))
+                    else:
+                        sub_item.setExpanded(True)
+                        sub_item.addChildren(
+                            [self._make_file_item(index) for index in range(start, end)]
+                        )
+
+    def _new_folder(self, sub_type: str, count: int) -> QTreeWidgetItem:
+        folder = QTreeWidgetItem([_sub_label(sub_type, count)])
+        folder.setFlags(
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsUserCheckable
+            | Qt.ItemFlag.ItemIsAutoTristate
+            | Qt.ItemFlag.ItemIsDropEnabled
+        )
+        folder.setCheckState(0, Qt.CheckState.Checked)
+        folder.setData(0, SUB_TYPE_ROLE, sub_type)
+        return folder
 
-    def _add_file_item(
-        self, parent: QTreeWidgetItem, cf: ClassifiedFile
+    def _insert_folder(
+        self, course_item: QTreeWidgetItem, course_name: str, sub_type: str
     ) -> QTreeWidgetItem:
-        item = QTreeWidgetItem(parent, [cf.path.name])
+        """Add an empty sub-type folder to a course, in _SUB_ORDER position."""
+        rank = _SUB_RANK[sub_type]
+        # Folders come first under a course, already in rank order
+        index = sum(
+            1
+            for (course, sub) in self._sub_nodes
+            if course == course_name and sub and _SUB_RANK[sub] < rank
+        )
+        folder = self._new_folder(sub_type, 0)
+        course_item.insertChild(index, folder)
+        folder.setExpanded(True)
+        self._sub_nodes[(course_name, sub_type)] = folder
+        return folder
+
+    def _load_children(self, folder: QTreeWidgetItem) -> None:
+        """Replace a folder's placeholder with its file items, if not yet done."""
+        if folder.childCount() != 1:
+            return
+        placeholder = folder.child(0)
+        span = placeholder.data(0, RANGE_ROLE)
+        if span is None:
+            return
+
+        start, end = span
+        with self._batch_update():
+            folder.removeChild(placeholder)
+            folder.addChildren([
+                self._make_file_item(index, bool(self._checked[index]))
+                for index in range(start, end)
+            ])
+
+    def _make_file_item(self, index: int, checked: bool = True) -> QTreeWidgetItem:
+        """Build the (unparented) item for self._files[index].
+
+        Callers insert a folder's items with one addChildren() call, which
+        the model reports as a single row insertion.
+        """
+        cf = self._files[index]
+        item = QTreeWidgetItem([cf.path.name])
         item.setFlags(
             Qt.ItemFlag.ItemIsEnabled
             | Qt.ItemFlag.ItemIsSelectable
             | Qt.ItemFlag.ItemIsUserCheckable
             | Qt.ItemFlag.ItemIsDragEnabled
         )
-        item.setCheckState(0, Qt.CheckState.Checked)
+        item.setCheckState(
+            0, Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        )
         item.setData(0, CF_ROLE, cf)
+        item.setData(0, INDEX_ROLE, index)
         return item
 
-    def _collect_checked(
-        self, item: QTreeWidgetItem, result: list[ClassifiedFile]
-    ) -> None:
-        cf = item.data(0, CF_ROLE)
-        if cf and item.checkState(0) == Qt.CheckState.Checked:
-            result.append(cf)
-        for i in range(item.childCount()):
-            self._collect_checked(item.child(i), result)
-
     def _on_item_changed(self, item: QTreeWidgetItem, column: int) -> None:
-        if not self._suppress_signals and column == 0:
-            self.selection_changed.emit(self.checked_count())
+        # Bulk operations run under _batch_update and set self._checked
+        # themselves, so this only sees single user toggles (and their cascade)
+        if column != 0:
+            return
+        on = item.checkState(0) == Qt.CheckState.Checked
+        index = item.data(0, INDEX_ROLE)
+        if index is not None:
+            if self._checked[index] != on:
+                self._checked[index] = on
+                self._checked_count += 1 if on else -1
+        else:
+            span = item.data(0, RANGE_ROLE)
+            if span is not None:
+                start, end = span
+                was = self._checked.count(1, start, end)
+                self._checked[start:end] = (b"\x01" if on else b"\x00") * (end - start)
+                self._checked_count += (end - start if on else 0) - was
+        self.selection_changed.emit(self.checked_count())
 
     # ── Context menu ──────────────────────────────────────────────────────
 
@@ -195,32 +365,39 @@ class FileTreeWidget(QTreeWidget):
         if not cf:
             return
 
-        menu = QMenu(self)
+        # Mark the file's current sub-type on the cached actions
+        for sub, action in self._recat_actions.items():
+            label = self._recat_labels[sub]
+            action.setText(f"{label} (current)" if sub == cf.sub_type else label)
+
+        chosen = self._context_menu.exec(self.viewport().mapToGlobal(pos))
+        if chosen is None:
+            return
+        if chosen is self._open_action:
+            self._open_file_location(cf.path)
+        elif chosen.data() is not None:
+            self._recategorize_item(item, cf, chosen.data())
+
+    def _build_context_menu(self) -> None:
+        """Create the file context menu once; it's re-labelled per use."""
+        self._context_menu = QMenu(self)
 
         # Recategorize submenu
-        recat_menu = menu.addMenu("Move to...")
+        recat_menu = self._recat_menu = self._context_menu.addMenu("Move to...")
+        self._recat_actions: dict[str, QAction] = {}
+        self._recat_labels: dict[str, str] = {}
         for sub in SUB_TYPES:
             icon = SUB_TYPE_ICONS.get(sub, "")
-            label = f"{icon} {sub}"
-            if sub == cf.sub_type:
-                label += " (current)"
-            action = recat_menu.addAction(label)
+            self._recat_labels[sub] = f"{icon} {sub}"
+            action = recat_menu.addAction(self._recat_labels[sub])
             action.setData(sub)
+            self._recat_actions[sub] = action
         recat_menu.addSeparator()
         root_action = recat_menu.addAction("\U0001f4c2 Course root")
         root_action.setData("")
 
-        recat_menu.triggered.connect(
-            lambda a: self._recategorize_item(item, cf, a.data())
-        )
-
         # Open file location
-        open_action = menu.addAction("Open file location")
-        open_action.triggered.connect(
-            lambda: self._open_file_location(cf.path)
-        )
-
-        menu.exec(self.viewport().mapToGlobal(pos))
+        self._open_action = self._context_menu.addAction("Open file location")
 
     def _recategorize_item(
         self, item: QTreeWidgetItem, cf: ClassifiedFile, new_sub: str
@@ -228,18 +405,19 @@ class FileTreeWidget(QTreeWidget):
         if new_sub == cf.sub_type:
             return
         cf.sub_type = new_sub
-        self.file_recategorized.emit()
+        if self.relocate_file_item(item):
+            self.setCurrentItem(item)
+        else:
+            self.file_recategorized.emit()
 
     def _open_file_location(self, path: Path) -> None:
-        import subprocess
-        import sys
-
+        # Detached: returns at once and the file manager outlives the app
         if sys.platform == "win32":
-            subprocess.Popen(["explorer", "/select,", str(path)])
+            QProcess.startDetached("explorer", ["/select,", str(path)])
         elif sys.platform == "darwin":
-            subprocess.Popen(["open", "-R", str(path)])
+            QProcess.startDetached("open", ["-R", str(path)])
         else:
-            subprocess.Popen(["xdg-open", str(path.parent)])
+            QProcess.startDetached("xdg-open", [str(path.parent)])
 
     # ── Drag and drop ─────────────────────────────────────────────────────
 
@@ -256,27 +434,29 @@ class FileTreeWidget(QTreeWidget):
             # Dropped on a file — use its sub_type
             new_sub = target_cf.sub_type
         else:
-            # Dropped on a folder — parse sub-type from label
-            label = target.text(0)
-            new_sub = None
-            for sub in SUB_TYPES:
-                if sub in label:
-                    new_sub = sub
-                    break
+            # Dropped on a folder ("" for a course node — move to course root)
+            new_sub = target.data(0, SUB_TYPE_ROLE)
             if new_sub is None:
-                # Dropped on a course node — move to course root
-                new_sub = ""
+                event.ignore()
+                return
 
-        # Update all dragged items
-        changed = False
-        for item in self.selectedItems():
+        # Update all dragged items, moving each into its new folder in place
+        needs_rebuild = False
+        selected = self.selectedItems()
+        for item in selected:
             cf = item.data(0, CF_ROLE)
             if cf and cf.sub_type != new_sub:
                 cf.sub_type = new_sub
-                changed = True
+                if not self.relocate_file_item(item):
+                    needs_rebuild = True
 
-        if changed:
+        if needs_rebuild:
             self.file_recategorized.emit()
+        elif selected:
+            # Re-parenting drops the selection; restore the whole of it
+            self.setCurrentItem(selected[-1])
+            for item in selected:
+                item.setSelected(True)
 
-        # Don't call super — we handle the move by rebuilding the tree
+        # Don't call super — we've re-parented the items ourselves
         event.accept()
@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-import shutil
 import sqlite3
-import tempfile
 from pathlib import Path
 
-from PySide6.QtCore import QThread, Signal, Slot
+from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, Signal, Slot
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -25,7 +23,17 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
-from classifier import ClassifiedFile, NewCourse, scan_downloads, _get_chrome_history_db
+from classifier import (
+    ClassifiedFile,
+    NewCourse,
+    history_mtime_ns,
+    load_last_scan,
+    save_last_scan,
+    scan_downloads,
+    _copy_history_db,
+    _get_chrome_history_db,
+    _open_history_db,
+)
 from config import load_config, save_config
 from file_ops import FileOps
 from gui.dialogs import (
@@ -35,26 +43,81 @@ from gui.dialogs import (
     SettingsDialog,
 )
 from gui.file_tree import FileTreeWidget
-from platforms.detector import PlatformDetector
+
+
+def _plur(n: int, word: str) -> str:
+    """'1 file', '3 files'."""
+    return f"{n} {word}" if n == 1 else f"{n} {word}s"
 
 
 # ── Background scan worker ────────────────────────────────────────────────
 
 
-class ScanWorker(QThread):
-    """Run the Chrome history scan in a background thread."""
+class ScanSignals(QObject):
+    """Signals for ScanWorker (a QRunnable can't define its own)."""
 
     finished = Signal(list, list)  # (classified_files, new_courses)
     error = Signal(str)
 
-    def __init__(self, config: dict, parent=None):
-        super().__init__(parent)
+
+class ScanWorker(QRunnable):
+    """Run the Chrome history scan on a QThreadPool thread.
+
+    Pooled, so the rescan after every move reuses a thread rather than
+    starting a new one.
+    """
+
+    def __init__(self, config: dict):
+        super().__init__()
         self.config = config
+        self.signals = ScanSignals()
 
     def run(self) -> None:
         try:
             files, new_courses = scan_downloads(self.config)
-            self.finished.emit(files, new_courses)
+            self.signals.finished.emit(files, new_courses)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+class DetectWorker(QThread):
+    """Detect school platforms from Chrome history in a background thread."""
+
+    finished = Signal(list)  # [{"domain", "platform_type", "download_count"}, ...]
+    error = Signal(str)
+
+    def __init__(self, chrome_db: Path, parent=None):
+        super().__init__(parent)
+        self.chrome_db = chrome_db
+
+    def run(self) -> None:
+        from platforms.detector import PlatformDetector
+
+        detector = PlatformDetector()
+        try:
+            # Read History in place (read-only, no locking); copy it only if
+            # that fails, the same way scan_downloads does
+            try:
+                conn = _open_history_db(self.chrome_db)
+                try:
+                    detected = detector.detect_from_history(conn.cursor())
+                finally:
+                    conn.close()
+            except sqlite3.DatabaseError:
+                conn = _open_history_db(_copy_history_db(self.chrome_db))
+                try:
+                    detected = detector.detect_from_history(conn.cursor())
+                finally:
+                    conn.close()
+
+            self.finished.emit([
+                {
+                    "domain": d.domain,
+                    "platform_type": d.platform_type,
+                    "download_count": d.download_count,
+                }
+                for d in detected
+            ])
         except Exception as e:
             self.error.emit(str(e))
 
@@ -74,7 +137,13 @@ class MainWindow(QMainWindow):
         self.config = load_config()
         self.file_ops = FileOps()
         self.classified_files: list[ClassifiedFile] = []
-        self._scan_worker: ScanWorker | None = None
+        # Signals of the scan in flight (None when idle); holding them keeps
+        # the QObject alive until its queued results are delivered
+        self._scan_signals: ScanSignals | None = None
+        self._detect_worker: DetectWorker | None = None
+        # History DB mtime behind self.classified_files (None = nothing scanned yet)
+        self._scan_mtime: int | None = None
+        self._pending_scan_mtime = 0
 
         self._build_ui()
         self._build_menu()
@@ -84,7 +153,7 @@ class MainWindow(QMainWindow):
         if not self.config.get("platforms"):
             self._first_run_setup()
         else:
-            self._run_scan()
+            self._show_last_scan()
 
     # ── UI Construction ───────────────────────────────────────────────────
 
@@ -189,7 +258,10 @@ class MainWindow(QMainWindow):
     # ── First-run platform detection ──────────────────────────────────────
 
     def _first_run_setup(self) -> None:
-        """Auto-detect platforms from Chrome history on first run."""
+        """Auto-detect platforms from Chrome history on first run.
+
+        Detection runs on a DetectWorker; the setup dialog opens when it's done.
+        """
         self._set_status("Detecting school platforms from Chrome history...")
 
         chrome_db = _get_chrome_history_db()
@@ -197,41 +269,31 @@ class MainWindow(QMainWindow):
             self._set_status("Chrome history not found. Configure platforms in Settings.")
             return
 
-        # Copy DB to avoid lock
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        tmp.close()
-        tmp_path = Path(tmp.name)
-        try:
-            shutil.copy2(chrome_db, tmp_path)
-            conn = sqlite3.connect(str(tmp_path))
-            detector = PlatformDetector()
-            detected = detector.detect_from_history(conn.cursor())
-            conn.close()
-        finally:
-            tmp_path.unlink(missing_ok=True)
+        self.btn_scan.setEnabled(False)
+        self._detect_worker = DetectWorker(chrome_db, self)
+        self._detect_worker.finished.connect(self._on_detect_finished)
+        self._detect_worker.error.connect(self._on_detect_error)
+        self._detect_worker.start()
 
-        # Show setup dialog
-        det_list = [
-            {
-                "domain": d.domain,
-                "platform_type": d.platform_type,
-                "download_count": d.download_count,
-            }
-            for d in detected
-        ]
+    @Slot(list)
+    def _on_detect_finished(self, det_list: list[dict]) -> None:
+        self.btn_scan.setEnabled(True)
 
+        # Show setup dialog
         dialog = PlatformSetupDialog(det_list, self)
         if dialog.exec() and dialog.confirmed:
             self.config["platforms"] = dialog.confirmed
             save_config(self.config)
-            self._set_status(
-                f"Configured {len(dialog.confirmed)} platform"
-                f"{'s' if len(dialog.confirmed) != 1 else ''}"
-            )
+            self._set_status(f"Configured {_plur(len(dialog.confirmed), 'platform')}")
             self._run_scan()
         else:
             self._set_status("No platforms configured. Use Settings to add one.")
 
+    @Slot(str)
+    def _on_detect_error(self, error_msg: str) -> None:
+        self.btn_scan.setEnabled(True)
+        self._set_status(f"Platform detection error: {error_msg}")
+
     # ── API key prompt ────────────────────────────────────────────────────
 
     def _ensure_api_key(self) -> bool:
@@ -276,8 +338,23 @@ class MainWindow(QMainWindow):
 
     # ── Scan ──────────────────────────────────────────────────────────────
 
+    def _show_last_scan(self) -> None:
+        """Show the previous session's results at once, then rescan if needed."""
+        files, mtime = load_last_scan(self.config)
+        if files:
+            self.classified_files = files
+            self._scan_mtime = mtime
+            self._rebuild_tree()
+        if not files or mtime != history_mtime_ns():
+            self._run_scan()
+
+    def closeEvent(self, event) -> None:
+        if self._scan_mtime is not None:
+            save_last_scan(self.classified_files, self.config, self._scan_mtime)
+        super().closeEvent(event)
+
     def _run_scan(self) -> None:
-        if self._scan_worker and self._scan_worker.isRunning():
+        if self._scan_signals is not None:
             return
 
         # Prompt for API key on first scan if missing
@@ -285,25 +362,35 @@ class MainWindow(QMainWindow):
 
         self._set_status("Scanning Chrome history & classifying files...")
         self.btn_scan.setEnabled(False)
+        self._pending_scan_mtime = history_mtime_ns()
 
-        self._scan_worker = ScanWorker(self.config, self)
-        self._scan_worker.finished.connect(self._on_scan_finished)
-        self._scan_worker.error.connect(self._on_scan_error)
-        self._scan_worker.start()
+        worker = ScanWorker(self.config)
+        worker.signals.finished.connect(self._on_scan_finished)
+        worker.signals.error.connect(self._on_scan_error)
+        self._scan_signals = worker.signals
+        QThreadPool.globalInstance().start(worker)
 
     @Slot(list, list)
     def _on_scan_finished(
         self, files: list[ClassifiedFile], new_courses: list[NewCourse]
     ) -> None:
+        self._scan_signals = None
         self.btn_scan.setEnabled(True)
-        self.classified_files = files
-        self._rebuild_tree()
+        self._scan_mtime = self._pending_scan_mtime
+        if files and files == self.classified_files:
+            # Nothing changed since the tree was built — keep it (and the
+            # user's checkbox state) rather than tearing it down.
+            self._show_scan_summary()
+        else:
+            self.classified_files = files
+            self._rebuild_tree()
 
         if new_courses:
             self._show_new_course_dialog(new_courses)
 
     @Slot(str)
     def _on_scan_error(self, error_msg: str) -> None:
+        self._scan_signals = None
         self.btn_scan.setEnabled(True)
         self._set_status(f"Scan error: {error_msg}")
 
@@ -311,13 +398,14 @@ class MainWindow(QMainWindow):
         known_courses = set(self.config.get("courses", {}).values())
         dest_root = self.config.get("destination_root", "")
         self.file_tree.populate(self.classified_files, dest_root, known_courses)
+        self._show_scan_summary()
 
-        total = len(self.classified_files)
+    def _show_scan_summary(self) -> None:
+        # The tree already counted both while grouping
+        total, courses = self.file_tree.stats
         if total:
-            courses = {cf.course_name for cf in self.classified_files}
             self._set_status(
-                f"Found {total} file{'s' if total != 1 else ''} "
-                f"across {len(courses)} course{'s' if len(courses) != 1 else ''}"
+                f"Found {_plur(total, 'file')} across {_plur(courses, 'course')}"
             )
         else:
             self._set_status("Scan complete \u2014 no files found")
@@ -335,10 +423,7 @@ class MainWindow(QMainWindow):
                 if cf.course_id in mapping:
                     cf.course_name = mapping[cf.course_id]
             self._rebuild_tree()
-            self._set_status(
-                f"Added {len(mapping)} new course"
-                f"{'s' if len(mapping) != 1 else ''} to config"
-            )
+            self._set_status(f"Added {_plur(len(mapping), 'new course')} to config")
 
     # ── Move ──────────────────────────────────────────────────────────────
 
@@ -359,12 +444,11 @@ class MainWindow(QMainWindow):
 
         result = self.file_ops.move_files(to_move, on_conflict="skip")
 
-        moved = len(result.success)
         skipped = len(result.skipped)
-        parts = [f"Moved {moved} file{'s' if moved != 1 else ''}"]
-        if skipped:
-            parts.append(f", skipped {skipped} (already exist)")
-        self._set_status("".join(parts))
+        self._set_status(
+            f"Moved {_plur(len(result.success), 'file')}"
+            + (f", skipped {skipped} (already exist)" if skipped else "")
+        )
 
         self._run_scan()
 
@@ -375,9 +459,7 @@ class MainWindow(QMainWindow):
             self._set_status("Nothing to undo")
             return
         undone = self.file_ops.undo_last()
-        self._set_status(
-            f"Undone {len(undone)} file{'s' if len(undone) != 1 else ''}"
-        )
+        self._set_status(f"Undone {_plur(len(undone), 'file')}")
         self._run_scan()
 
     # ── Recategorize ──────────────────────────────────────────────────────
@@ -400,13 +482,16 @@ class MainWindow(QMainWindow):
         if dialog.exec() and dialog.selected_sub is not None:
             if dialog.selected_sub != cf.sub_type:
                 cf.sub_type = dialog.selected_sub
-                self._rebuild_tree()
+                if self.file_tree.relocate_file_item(item):
+                    self.file_tree.setCurrentItem(item)
+                else:
+                    self._rebuild_tree()
                 label = cf.sub_type if cf.sub_type else "course root"
                 self._set_status(f"Moved '{cf.path.name}' to {label}")
 
     @Slot()
     def _on_file_recategorized(self) -> None:
-        """Called when a file is recategorized via drag-drop or context menu."""
+        """Called when a drag-drop or context-menu move needs a full rebuild."""
         self._rebuild_tree()
 
     # ── Settings ──────────────────────────────────────────────────────────
@@ -415,6 +500,7 @@ class MainWindow(QMainWindow):
         dialog = SettingsDialog(self.config, self)
         if dialog.exec() and dialog.saved:
             self.config = load_config()
+            self._scan_mtime = None  # results on screen predate these settings
             self._set_status("Settings saved")
             self._run_scan()
 
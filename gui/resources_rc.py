@@ -0,0 +1,158 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.7.3
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x00\xea\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x12\x00\x00\x00\x12\x08\x06\x00\x00\x00V\xce\x8eW\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\x9cIDAT8\x8d\xed\
+\xd4\xb1\x0d\x830\x10F\xe1w\xa7c\x83t,\xc1\x16\
+tL\x83\xc4\x0cH\x99\x81!\xd2\xb1E\x96\xa0\xf3\x06\
+\xb6|)\xdcDQ\x0ab\xa7\xe4\x1f\xe0\xd3\xbb\xc2\x16\
+\x80\xfb\xc3oI\xe3\x0a2\x0a\xdesb\x8e\x1c\xe0\xbb\
+\xe5n\x99'\x09R\x90\xf4<\x0b|\x03-\xdb`I\
+\xe3*P\x85\x00\x08\xde'\x8d\xab\x82\x8c\xb5\xc8\x1b7\
+j\xedI\x9fU\xda^SvA\x17\xf4\x17\xa8\xbc\xe2\
+\xb69r(\xf8\xde\xde\xe3\xbbZ\xee\x96\x96\xaa\xf2\x8d\
+t\x8b\xce\x93\x04\xcb68l\xbf\x80\x8e\x1c\x0e\x9be\
+\x1b\xe6I\xc2\x0b\x95F:E\x7f\xbc\x10\xa0\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x02N\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00$\x00\x00\x00$\x08\x06\x00\x00\x00\xe1\x00\x98\x98\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x02\x00IDATX\x85\xed\
+\x98?h\x13Q\x1c\xc7?\xbf\xf7\xd2:H\x8bS\xa1\
+8\x06\x9c\xda\xc6v\xb0\xc6\xc5\xdd%\xd3A\xa0\x17p\
+\x13\xec`\x84\x82[k+\x08\x82\x7f2H\xa1\x9b\xd0\
+\xa6\x15n\xca\xda\xc5MR+-4\x01\x07\xc9(B\
+\xd6\xc4\xc5\xe6\xf2sh\xda^N\xec)^\xd2\xe5>\
+\xd3\xbd\xdf\xef\xc1\xf7\xc3\xdd\xe3\xe0\xfd\x84\x10\xae[\x9c\
+\xec\xc0\x03Ur\x06\xd2\x0ac\xe1=\xff\x83@\xab\x0b\
+\x0d\x11*)\xd8\xd8\xda*}\x0f\xf5\xcf\x9f\xf3\x0b\xc5\
+\x87\xc0\x0b\xe0j\x9c\x12\x17\xf0\x03x\xf2\xbe\x5cZ\x07\
+\x14\xc0\x9e\xc9\xb8\x8f^\x81<\x03F\x87$C/\xeb\
+\xdeTf~\xbc~\xb4\xb7{&\x94_(.\xf6d\
+.\x09\xc9N\xcfd\x9b\xf5Zu_\x5c\xb78\xd9Q\
+\xbe\xd2\xff\x99>\x19\xd5ekG\x0e77_6\xe3\
+\x8c.\x14\x96&|\xffx\xb6+\xb2\x06\xdc\x0a\xb4\xda\
+)\xe1\x86\xe4\xdd\xe2S\x94\x95\xa0\x8c\xff\xf3\xdb\x1d\xcf\
+\xf3\xfc8E\xc28\x8ec\xed\xe8\xf5\x8f}R\xc2\xaa\
+Q%\x17\xdchT\x97\x07-\x03\xe0y\x9e/\x22\xc1\
+\x17\x81*9c \x1d,Z;r8h\x99SR\
+b\x0f\x82k\x03i\x13\xfe\xcf\xc4}f.\x22\x9c\xa5\
+0f\x86\x15\xfe\xb7$BQ$BQ$BQ$\
+BQ$BQ$BQ$BQ$BQ$B\
+Q\x18\x81V\xb0P(,M\x0c+<\x9c%\xd02\
+]h\x04\x8b\xbe\x7f<;,\xa1\x8e\xfas\xc1u\x17\
+\x1aF\x84J_Qd\xcdq\x1c\xcb\x80q\x1c\xc7\xaa\
+\xeaj\xb0&B\xe5\x8fWi\x11YI\x89=\x18\xc4\
+U\xba\xa3\xfe\x5cO\xe6\xf7\xab4\x9c\x0e\x1bx\x1bg\
+\xf0\xbf\x22\xc8\xe2N\xf9\xcd\xba\x05\xa8\xd7\xaa\x9f\xa72\
+\xf3\xe3 \xd9K\x91Q^\xefl\x97\x9e\xc3\xf9|\x88\
+\xfa\xd1\xde\xee\xf4L\xb6\x09\xdcex3\xa2\xb6 \x8f\
+{2}\x03\xab\x13\xa9Zu\xfff\xe6\xf6\xbb\xae\xd0\
+V\xb8fN\xce\xd5\x958\x0d\x04Z\x0a_D\xd8H\
+\x09\xf7\xb7\xcb\xa5\x0f\xc1\xfe/\xa8\xd7\xa5ly\x0eI\
+\x9e\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x01\x1e\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x12\x00\x00\x00\x12\x08\x06\x00\x00\x00V\xce\x8eW\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\xd0IDAT8\x8d\xed\
+\xd41\x0a\xc20\x18\x86\xe17\x89tt\x90\xe2\xd2\x1e\
+A\x07g\x0f\xd0\x0b\xd8A\xef\xd0A\x1c<C\x87\xe2\
+\xe0\x11\x04;\xd4\x0b\xf4\x04\x8e.=\x82\xdd\x8a\xa3C\
+\xa1\xa9C\x03\x16Ah\xc0\xd1oJ\x86\xef!\x09\xfc\
+\x11\x00\xeb\xf5\xceme\x13\x03\x01\xe01,%\x90\x0b\
+\xad\xf6i\x9aT\xc2 7\xc0\x1f\x08|\xe6.\xb4Z\
+\x8c\xccI|h\xcfM-\xa3,;<\x86\xb4\xc3p\
+;Q\x8e>\x82\xd8\xb4\xb2\x89%\xddu\xb0A\x00\xb2\
+\xec\xf0hj\x19\x99m 1ob\x83\xf41\xb3\xf4\
+\xa4m\xf9[\xfe\xd0\x1f\xfa\x15TB7;\xb6\xe5^\
+\xa7\x94@\x0e\xa0\x1c}\xb4\xc1\xdeC\x0b@\xfe\xb3o\
+D\x15\xc5\xf59\x9f-O\x88\xd6\x05\xa6\xc0x P\
+\x02\x17\xa1\xd5*M\x93\xea\x05\x96EMCH\xe5\xd4\
+\xf7\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x01\x8b\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00$\x00\x00\x00$\x08\x06\x00\x00\x00\xe1\x00\x98\x98\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x01=IDATX\x85\xed\
+\xd8\xb1j\xc2P\x14\x80\xe1\xff\x5cr\xb3\xb4>\x80\xb3\
+\xd0g\x11-\xf8\x18B3\x15\x8bwp\x16\xea\xd0\xba\
+\x14\x8b\x8f\xe1`\xf1]\x8a\xb3\x0f`\x5c\x92\xc0\xe9\xa0\
+\x95(\xc8\x1d\x14\x93\xe1~S \x19~\x08\xe7\xc2=\
+\xc2\x99\xf1J\x9bQ\x9e\xf5\x11\xe9\x01-\xa0q\xfe\xcd\
+\x95\xb6\xc0\x1a\xd5Ea\xe3\xf9\xa8-\x9b\xf2K\xf9\x7f\
+PU\x99\xfc\xe4/\xa2L\x80\x87\x1bG\x5c\xb2S\xc1\
+\xb9\x8e\x9d\x89\x88\x1e\x83TU&\xcb\xfcC\xe0\xf5N\
+!'\x14\xa6\xaek\x07\x22\xa2\x02\xf0\xbe\xcc\x12Q\xbe\
+\xaa\x88)I\xdcs<\x93\xf1J\x9bQ\x91\xffr\xbf\
+\xdftIZD\xf6\xc9Dy\xd6\xafA\x0c\xc0c\x94\
+g}s\x98\xa6z\x10\xe9\x19\xf6\xa3]\x17-\xc3\xed\
+\xcf\x99k4L\xd5\x05\xe7B\x90O\x08\xf2\x09A>\
+!\xc8'\x04\xf9\x84 \x9f\x10\xe4\x13\x82|B\x90\x8f\
+a\x7f\xd7\xae\x8b\xad\x01\xd6UW\x94\xac\x0d\xaa\x8b\xaa\
++\x8eT\x17\xa6\xb0\xf1\x1c\xd8U\xdd\x02\xa4\x85\x8d\xe7\
+f\xd4\x96\x8d\x0a\xae\xea\x1a\xc0\x8d\xda\xb21\x00\xaec\
+g\x0a\xd3\xcaR\x84\xcfa\xd7~\xc3a\xecED]\
+\xd7\x0e\x80\x04H\xef\x98\x92\x02\xc9\xb0c\xdfN\x16V\
+eU\xaf\xf4\xfe\x006\xf2b\xe7\xfbtu\xa7\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x03\
+\x00\x00p7\
+\x00i\
+\x00m\x00g\
+\x00\x09\
+\x0b\x9e\x84\x87\
+\x00c\
+\x00h\x00e\x00c\x00k\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x0a\xa6;\xa7\
+\x00u\
+\x00n\x00c\x00h\x00e\x00c\x00k\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x0b\
+\x0bf\xc4\x87\
+\x00u\
+\x00n\x00c\x00h\x00e\x00c\x00k\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x0e\xa6$\xa7\
+\x00c\
+\x00h\x00e\x00c\x00k\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00$\x00\x00\x00\x00\x00\x01\x00\x00\x00\xee\
+\x00\x00\x01\xa1>\xaf]v\
+\x00\x00\x00F\x00\x00\x00\x00\x00\x01\x00\x00\x03@\
+\x00\x00\x01\xa1>\xaf]u\
+\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1>\xaf]n\
+\x00\x00\x00b\x00\x00\x00\x00\x00\x01\x00\x00\x04b\
+\x00\x00\x01\xa1>\xaf]v\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -1,4 +1,10 @@
-"""QSS stylesheet definitions for School File Classifier."""
+"""QSS stylesheet definitions for School File Classifier.
+
+Checkbox images come from gui/resources.qrc; after changing anything under
+gui/assets, regenerate with ``pyside6-rcc gui/resources.qrc -o gui/resources_rc.py``.
+"""
+
+from gui import resources_rc  # noqa: F401  (registers the :/img/ resources)
 
 DARK_STYLE = """
 QMainWindow {
@@ -28,22 +34,17 @@ QTreeWidget::item:hover {
     background-color: #313244;
 }
 
+QTreeWidget::indicator {
+    width: 18px;
+    height: 18px;
+}
+
 QTreeWidget::indicator:checked {
-    image: none;
-    background-color: #89b4fa;
-    border: 2px solid #89b4fa;
-    border-radius: 3px;
-    width: 14px;
-    height: 14px;
+    image: url(:/img/check.png);
 }
 
 QTreeWidget::indicator:unchecked {
-    image: none;
-    background-color: transparent;
-    border: 2px solid #585b70;
-    border-radius: 3px;
-    width: 14px;
-    height: 14px;
+    image: url(:/img/uncheck.png);
 }
 
 QToolBar {
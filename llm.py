@@ -1,94 +1,189 @@
 """LLM-based file sub-classification using Groq API."""
 
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 MODEL = "llama-3.1-8b-instant"
 
 VALID_CATEGORIES = {"Lectures", "Tutorials", "Assignments", "Other"}
 
+# Lowercased category (plural or singular) -> canonical category name
+_CANON = {c.lower(): c for c in VALID_CATEGORIES}
+_CANON.update({c.lower().rstrip("s"): c for c in VALID_CATEGORIES})
+
+# Filenames that name their category outright are classified locally and never
+# sent to the API.  Words are matched at a letter boundary rather than \b, since
+# "_" counts as a word character ("CS101_Lecture3.pdf").  A name that matches
+# more than one category ("Lecture 5 quiz") is left for the LLM to decide.
+_FAST: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(r"(?i)(?<![a-z])(?:lecture|slides?(?![a-z])|lec\d)"), "Lectures"),
+    (
+        re.compile(r"(?i)(?<![a-z])(?:tutorial|quiz|problem[_ ]?sets?|ps\d)"),
+        "Tutorials",
+    ),
+    (
+        re.compile(
+            r"(?i)(?<![a-z])(?:assignment|homework|hw\d|coursework"
+            r"|exam(?!ple)|mock(?![a-z])|mock[_ ]?exam)"
+        ),
+        "Assignments",
+    ),
+]
+
+# Output budget: each '"12": "Assignments", ' entry is about 8 tokens, plus the
+# braces.  A reply cut off at the limit is re-requested once with twice this.
+_MAX_TOKENS_BASE = 8
+_MAX_TOKENS_PER_FILE = 8
+
+# Long lists are split into chunks of this many filenames, sent concurrently
+_CHUNK_SIZE = 40
+_MAX_CONCURRENT_REQUESTS = 4
+
+# One pooled session for every call, so repeat scans reuse the TLS connection
+# to Groq.  Rate limits and transient 5xx errors get two retries with short
+# backoff; classification is idempotent, so POST is retried.  Retry-After is
+# ignored: it can ask for minutes, and a chunk that stays throttled should
+# fall back to "Other" rather than hold up the scan.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=False,
+        ),
+    ),
+)
+
 SYSTEM_PROMPT = """\
 You are a file classifier for university course materials.
-Given a filename, classify it into exactly ONE of these categories:
+Classify each filename into exactly ONE of these categories:
 
 - Lectures  (lecture slides, lecture notes, class presentations)
 - Tutorials (tutorial sheets, tutorial solutions, practice questions, quizzes, problem sets)
 - Assignments (coursework, group assignments, homework, individual assignments, exams, mock exams)
 - Other (case studies, datasets, code examples, admin documents, supplementary materials, anything else)
 
-Respond with ONLY the category name. No explanation, no punctuation.\
+Use these category names exactly. No explanation.\
 """
 
 
 def _normalise(text: str) -> str:
     """Normalise an LLM response to one of the valid categories."""
     cleaned = text.strip().rstrip(".").strip()
-    if cleaned in VALID_CATEGORIES:
-        return cleaned
-    lower = cleaned.lower()
-    for cat in VALID_CATEGORIES:
-        if lower == cat.lower() or lower == cat.lower().rstrip("s"):
-            return cat
-    return "Other"
+    return _CANON.get(cleaned.lower(), "Other")
+
+
+def _fast_category(filename: str) -> str | None:
+    """Return the category *filename* unambiguously names, else None."""
+    found = None
+    for pattern, cat in _FAST:
+        if pattern.search(filename):
+            if found is not None:
+                return None
+            found = cat
+    return found
 
 
 def classify_batch(filenames: list[str], api_key: str) -> list[str]:
-    """Classify multiple filenames in a single API call.
+    """Classify multiple filenames, one API call per chunk of _CHUNK_SIZE.
 
+    Obvious names are settled by the _FAST patterns; only the rest are sent
+    to the API.  Chunks are requested concurrently, so a long list costs
+    roughly one round trip rather than one per chunk, and no single reply
+    has to stay aligned over hundreds of numbered lines.
     Returns list of categories in the same order as input.
     """
     if not api_key or not filenames:
         return ["Other"] * len(filenames)
 
-    numbered = "\n".join(f"{i+1}. {fn}" for i, fn in enumerate(filenames))
+    results: list[str] = []
+    residual_indices: list[int] = []
+    for i, fn in enumerate(filenames):
+        cat = _fast_category(fn)
+        if cat is None:
+            residual_indices.append(i)
+            cat = "Other"
+        results.append(cat)
+    if not residual_indices:
+        return results
+    if len(residual_indices) == len(filenames):
+        return _classify_remote(filenames, api_key)
+
+    residual = [filenames[i] for i in residual_indices]
+    for i, cat in zip(residual_indices, _classify_remote(residual, api_key)):
+        results[i] = cat
+    return results
+
+
+def _classify_remote(filenames: list[str], api_key: str) -> list[str]:
+    """Classify *filenames* via the API, in concurrent chunks if needed."""
+    if len(filenames) <= _CHUNK_SIZE:
+        return _classify_chunk(filenames, api_key)
+
+    chunks = [
+        filenames[i : i + _CHUNK_SIZE] for i in range(0, len(filenames), _CHUNK_SIZE)
+    ]
+    workers = min(_MAX_CONCURRENT_REQUESTS, len(chunks))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(lambda chunk: _classify_chunk(chunk, api_key), chunks)
+        return [cat for part in parts for cat in part]
+
+
+def _classify_chunk(filenames: list[str], api_key: str) -> list[str]:
+    """Classify filenames in a single API call ("Other" for all on failure)."""
+    numbered = "\n".join([f"{i}. {fn}" for i, fn in enumerate(filenames, 1)])
     user_prompt = (
-        f"Classify each file. Respond with ONLY a numbered list, one per line.\n"
-        f"Example format:\n1. Lectures\n2. Tutorials\n3. Assignments\n\n"
-        f"Files:\n{numbered}"
+        "Classify each file. Respond with ONLY a JSON object mapping each "
+        "file's number to its category.\n"
+        'Example format: {"1": "Lectures", "2": "Tutorials", "3": "Assignments"}'
+        f"\n\nFiles:\n{numbered}"
     )
 
+    max_tokens = _MAX_TOKENS_BASE + _MAX_TOKENS_PER_FILE * len(filenames)
     try:
-        resp = requests.post(
-            GROQ_API_URL,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": MODEL,
-                "messages": [
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                "temperature": 0,
-                "max_tokens": len(filenames) * 15,
-            },
-            timeout=30,
-        )
-        resp.raise_for_status()
-        answer = resp.json()["choices"][0]["message"]["content"].strip()
+        for _attempt in range(2):
+            resp = _SESSION.post(
+                GROQ_API_URL,
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": MODEL,
+                    "messages": [
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    "temperature": 0,
+                    "response_format": {"type": "json_object"},
+                    "max_tokens": max_tokens,
+                },
+                timeout=30,
+            )
+            resp.raise_for_status()
+            choice = resp.json()["choices"][0]
+            if choice.get("finish_reason") != "length":
+                break
+            max_tokens *= 2
+        answer = json.loads(choice["message"]["content"])
     except Exception:
         return ["Other"] * len(filenames)
+    if not isinstance(answer, dict):
+        return ["Other"] * len(filenames)
 
-    # Parse "1. Lectures\n2. Tutorials\n..." format
-    results: list[str] = []
-    for line in answer.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        # Strip leading number + punctuation: "1. ", "1) ", "1: " etc.
-        for i, ch in enumerate(line):
-            if not ch.isdigit():
-                # Skip separator chars after the number
-                rest = line[i:].lstrip(".):- ").strip()
-                results.append(_normalise(rest))
-                break
-        else:
-            # Line was all digits (shouldn't happen)
-            results.append("Other")
-
-    # Pad if LLM returned fewer lines than expected
-    while len(results) < len(filenames):
-        results.append("Other")
-
-    return results[: len(filenames)]
+    # {"1": "Lectures", "2": "Tutorials", ...} — missing numbers become "Other"
+    return [
+        _normalise(str(answer.get(str(i + 1), ""))) for i in range(len(filenames))
+    ]
@@ -6,13 +6,43 @@ import sqlite3
 from abc import ABC, abstractmethod
 
 
+_COURSE_TITLES_SQL = """
+WITH pat(course_id, pattern) AS (VALUES {values})
+SELECT course_id, title
+FROM (
+    SELECT p.course_id, u.title,
+           ROW_NUMBER() OVER (
+               PARTITION BY p.course_id ORDER BY u.last_visit_time DESC
+           ) AS rank
+    FROM pat p
+    JOIN urls u ON u.url LIKE p.pattern
+    WHERE u.title != ''
+)
+WHERE rank <= 5
+ORDER BY course_id, rank
+"""
+
+# Course count -> title query text, built once per size so sqlite3's
+# statement cache can reuse the prepared statement across lookups.
+_titles_stmt_cache: dict[int, str] = {}
+
+
+def _course_titles_sql(n_courses: int) -> str:
+    """Return the batched course title query for *n_courses* courses."""
+    sql = _titles_stmt_cache.get(n_courses)
+    if sql is None:
+        values = ", ".join(["(?, ?)"] * n_courses)
+        sql = _titles_stmt_cache[n_courses] = _COURSE_TITLES_SQL.format(values=values)
+    return sql
+
+
 class PlatformAdapter(ABC):
     """Adapter interface for extracting course info from a specific LMS platform.
 
     Each adapter knows how to:
     - Recognise URLs belonging to its platform
     - Extract course IDs from download/page URLs
-    - Discover course names from Chrome page titles
+    - Discover course names from Chrome page titles (one query per batch)
     - Correlate downloads with recently visited course pages
     """
 
@@ -42,6 +72,17 @@ class PlatformAdapter(ABC):
         """
 
     @abstractmethod
+    def course_page_pattern(self, course_id: str, domain: str) -> str:
+        """Return a SQL ``LIKE`` pattern matching *course_id*'s page URLs."""
+
+    @abstractmethod
+    def clean_course_title(self, title: str) -> str:
+        """Strip platform boilerplate from a course page *title*.
+
+        Returns an empty string if the title doesn't name the course
+        (e.g. a bare "Loading" or the platform's own name).
+        """
+
     def discover_course_name(
         self, cursor: sqlite3.Cursor, course_id: str, domain: str
     ) -> str:
@@ -49,12 +90,72 @@ class PlatformAdapter(ABC):
 
         Returns an empty string if no name could be discovered.
         """
+        return self.discover_course_names(cursor, [course_id], domain).get(
+            course_id, ""
+        )
 
-    @abstractmethod
-    def infer_course_from_visits(
-        self, cursor: sqlite3.Cursor, download_time: int, domain: str
-    ) -> str | None:
-        """Fallback: find the most recently visited course page before *download_time*.
+    def discover_course_names(
+        self, cursor: sqlite3.Cursor, course_ids: list[str], domain: str
+    ) -> dict[str, str]:
+        """Batch form of :meth:`discover_course_name`, in a single query.
+
+        Each course's five most recently visited titled pages are tried in
+        order, as with a lone lookup.  Courses with no usable title are
+        left out of the result.
+        """
+        if not course_ids:
+            return {}
+        params: list[str] = []
+        for course_id in course_ids:
+            params.extend([course_id, self.course_page_pattern(course_id, domain)])
+        cursor.execute(_course_titles_sql(len(course_ids)), params)
+        names: dict[str, str] = {}
+        for course_id, title in cursor:
+            if course_id not in names:
+                cleaned = self.clean_course_title(title)
+                if cleaned:
+                    names[course_id] = cleaned
+        return names
+
+    def course_visit_patterns(self, domain: str) -> list[str]:
+        """SQL ``LIKE`` patterns for the page URLs that can name a course.
+
+        Only visits to matching pages are considered by
+        :meth:`course_visit_timeline`.  The default takes any page on
+        *domain*; adapters narrow it to their course page URLs.
+        """
+        return [f"%{domain}%"]
+
+    def course_visit_timeline(
+        self, cursor: sqlite3.Cursor, domain: str
+    ) -> tuple[list[int], list[str]]:
+        """Return ``(visit_times, course_ids)`` for course page visits on *domain*.
 
-        Returns a course ID string, or None.
+        Both lists are sorted oldest first, so the course last visited before
+        a download is a ``bisect_right`` on ``visit_times``.  Uses
+        :meth:`course_visit_patterns` and :meth:`extract_course_id` to pick
+        out course pages; override if the platform needs something smarter.
         """
+        patterns = self.course_visit_patterns(domain)
+        url_filter = " OR ".join(["u.url LIKE ?"] * len(patterns))
+        cursor.execute(
+            f"""
+            SELECT v.visit_time, u.url
+            FROM visits v
+            JOIN urls u ON v.url = u.id
+            WHERE {url_filter}
+            ORDER BY v.visit_time
+            """,
+            patterns,
+        )
+        visit_times: list[int] = []
+        course_ids: list[str] = []
+        ids_by_url: dict[str, str | None] = {}
+        for visit_time, url in cursor:
+            if url not in ids_by_url:
+                ids_by_url[url] = self.extract_course_id(url)
+            course_id = ids_by_url[url]
+            if course_id:
+                visit_times.append(visit_time)
+                course_ids.append(course_id)
+        return visit_times, course_ids
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 import sqlite3
 from dataclasses import dataclass
 from urllib.parse import urlparse
@@ -24,6 +25,14 @@ class PlatformDetector:
 
     def __init__(self, adapters: list[PlatformAdapter] | None = None):
         self._adapters = adapters or ALL_ADAPTERS
+        # Each adapter's fingerprints as one alternation, so each URL is
+        # checked with a single regex search per adapter.  Adapters without
+        # fingerprints never auto-match.
+        self._fingerprint_res = [
+            (adapter, re.compile("|".join(map(re.escape, adapter.url_fingerprints))))
+            for adapter in self._adapters
+            if adapter.url_fingerprints
+        ]
 
     def detect_from_history(
         self, cursor: sqlite3.Cursor
@@ -32,64 +41,66 @@ class PlatformDetector:
 
         Returns a list of detected platforms with their domains and adapters.
         """
-        # Get all unique download domains with counts
+        # Distinct download URLs with how often each appears (as a tab URL
+        # or referrer), so each URL is only parsed once.
         cursor.execute(
             """
-            SELECT tab_url, referrer
-            FROM downloads
-            WHERE tab_url != '' OR referrer != ''
+            SELECT url, COUNT(*)
+            FROM (
+                SELECT tab_url AS url FROM downloads WHERE tab_url != ''
+                UNION ALL
+                SELECT referrer FROM downloads WHERE referrer != ''
+            )
+            GROUP BY url
             """
         )
 
-        # Collect domain -> set of URLs for fingerprint matching
-        domain_urls: dict[str, set[str]] = {}
+        # Match as the URLs arrive instead of keeping every URL per domain.
+        # A domain's rank is the index of the highest-priority adapter that
+        # has matched it so far (len(...) for none); later URLs only need
+        # checking against adapters ranked above that, so once the first
+        # adapter matches, the rest of the domain's URLs cost nothing.
+        unmatched = len(self._fingerprint_res)
+        domain_ranks: dict[str, int] = {}
         domain_counts: dict[str, int] = {}
-        for tab_url, referrer in cursor.fetchall():
-            for url in (tab_url, referrer):
-                if not url:
-                    continue
-                try:
-                    parsed = urlparse(url)
-                    domain = parsed.netloc
-                    if not domain:
-                        continue
-                except Exception:
-                    continue
-                domain_urls.setdefault(domain, set()).add(url)
-                domain_counts[domain] = domain_counts.get(domain, 0) + 1
-
-        # Match each domain against adapters
-        results: list[DetectedPlatform] = []
-        matched_domains: set[str] = set()
-
-        for domain, urls in domain_urls.items():
-            if domain in matched_domains:
+        for url, count in cursor:
+            try:
+                domain = urlparse(url).netloc
+            except Exception:
+                continue
+            if not domain:
                 continue
-            for adapter in self._adapters:
-                if self._domain_matches(domain, urls, adapter):
-                    results.append(DetectedPlatform(
-                        domain=domain,
-                        platform_type=adapter.name.lower(),
-                        adapter=adapter,
-                        download_count=domain_counts.get(domain, 0),
-                    ))
-                    matched_domains.add(domain)
-                    break
+            domain_counts[domain] = domain_counts.get(domain, 0) + count
+            rank = domain_ranks.get(domain)
+            if rank is None:
+                rank = self._match_rank(domain, unmatched)
+            if rank:
+                rank = self._match_rank(url, rank)
+            domain_ranks[domain] = rank
+
+        results = [
+            DetectedPlatform(
+                domain=domain,
+                platform_type=self._fingerprint_res[rank][0].name.lower(),
+                adapter=self._fingerprint_res[rank][0],
+                download_count=domain_counts[domain],
+            )
+            for domain, rank in domain_ranks.items()
+            if rank < unmatched
+        ]
 
         # Sort by download count (most downloads first)
         results.sort(key=lambda p: p.download_count, reverse=True)
         return results
 
-    def _domain_matches(
-        self, domain: str, urls: set[str], adapter: PlatformAdapter
-    ) -> bool:
-        """Check if a domain's URLs match any fingerprint of the adapter."""
-        for fingerprint in adapter.url_fingerprints:
-            # Check if the fingerprint matches the domain itself
-            if fingerprint in domain:
-                return True
-            # Check if any URL from this domain contains the fingerprint
-            for url in urls:
-                if fingerprint in url:
-                    return True
-        return False
+    def _match_rank(self, text: str, limit: int) -> int:
+        """Index of the first adapter below *limit* fingerprinted in *text*.
+
+        Returns *limit* if none of them match.
+        """
+        for rank, (_adapter, fingerprint_re) in enumerate(
+            self._fingerprint_res[:limit]
+        ):
+            if fingerprint_re.search(text):
+                return rank
+        return limit
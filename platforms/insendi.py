@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import re
-import sqlite3
 
 from .base import PlatformAdapter
 
@@ -31,42 +30,14 @@ class InsendiAdapter(PlatformAdapter):
         m = _COURSE_RE.search(url)
         return m.group(1) if m else None
 
-    def discover_course_name(
-        self, cursor: sqlite3.Cursor, course_id: str, domain: str
-    ) -> str:
-        cursor.execute(
-            """
-            SELECT title
-            FROM urls
-            WHERE url LIKE ?
-              AND title != ''
-            ORDER BY last_visit_time DESC
-            LIMIT 5
-            """,
-            (f"%{domain}%/courses/{course_id}%",),
-        )
-        for (title,) in cursor.fetchall():
-            cleaned = _TITLE_SUFFIX_RE.sub("", title).strip()
-            if cleaned and cleaned.lower() not in ("", "insendi", "loading"):
-                return cleaned
-        return ""
+    def course_page_pattern(self, course_id: str, domain: str) -> str:
+        return f"%{domain}%/courses/{course_id}%"
 
-    def infer_course_from_visits(
-        self, cursor: sqlite3.Cursor, download_time: int, domain: str
-    ) -> str | None:
-        cursor.execute(
-            """
-            SELECT u.url
-            FROM visits v
-            JOIN urls u ON v.url = u.id
-            WHERE u.url LIKE ?
-              AND v.visit_time <= ?
-            ORDER BY v.visit_time DESC
-            LIMIT 1
-            """,
-            (f"%{domain}%/courses/%", download_time),
-        )
-        row = cursor.fetchone()
-        if row:
-            return self.extract_course_id(row[0])
-        return None
+    def clean_course_title(self, title: str) -> str:
+        cleaned = _TITLE_SUFFIX_RE.sub("", title).strip()
+        if cleaned.lower() in ("insendi", "loading"):
+            return ""
+        return cleaned
+
+    def course_visit_patterns(self, domain: str) -> list[str]:
+        return [f"%{domain}%/courses/%"]